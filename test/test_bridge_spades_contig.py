@@ -0,0 +1,61 @@
+"""
+Copyright 2017 Ryan Wick (rrwick@gmail.com)
+https://github.com/rrwick/Unicycler
+
+This file is part of Unicycler. Unicycler is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by the Free Software Foundation,
+either version 3 of the License, or (at your option) any later version. Unicycler is distributed in
+the hope that it will be useful, but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+details. You should have received a copy of the GNU General Public License along with Unicycler. If
+not, see <http://www.gnu.org/licenses/>.
+"""
+
+import unittest
+import os
+import math
+import unicycler.assembly_graph
+import unicycler.bridge_spades_contig
+import unicycler.log
+
+
+class TestSpadesContigBridge(unittest.TestCase):
+    """
+    Tests SPAdes contig bridge quality on a small graph where segment 2 is a repeat which the
+    bridge path (1 -> 2 -> 3 -> 2 -> 4) passes through twice.
+    """
+
+    def setUp(self):
+        test_gfa = os.path.join(os.path.dirname(__file__), 'test_bridge_spades_contig.gfa')
+        self.graph = unicycler.assembly_graph.AssemblyGraph(test_gfa, 0, insert_size_mean=1000,
+                                                            insert_size_deviation=100)
+        unicycler.log.logger = unicycler.log.Log(log_filename=None, stdout_verbosity_level=0)
+        self.connected_segments = {x: set(self.graph.get_connected_segments(x))
+                                   for x in self.graph.segments}
+
+    def make_bridge(self):
+        return unicycler.bridge_spades_contig.SpadesContigBridge(
+            graph=self.graph, spades_contig_path=[1, 2, 3, 2, 4],
+            connected_segments=self.connected_segments)
+
+    def test_path_is_self_contained(self):
+        self.assertTrue(unicycler.bridge_spades_contig.path_is_self_contained(
+            [2, 3, 2], 1, 4, self.connected_segments))
+        self.assertFalse(unicycler.bridge_spades_contig.path_is_self_contained(
+            [2], 1, 4, self.connected_segments))
+
+    def test_repeat_segment_with_double_depth(self):
+        # Segment 2 has twice the start/end depth and appears twice in the path, so the path's
+        # depth consistency shouldn't lower the quality.
+        bridge = self.make_bridge()
+        self.assertEqual(bridge.start_segment, 1)
+        self.assertEqual(bridge.end_segment, 4)
+        self.assertEqual(bridge.graph_path, [2, 3, 2])
+        self.assertAlmostEqual(bridge.depth, 10.0)
+        self.assertAlmostEqual(bridge.quality, 100.0 * math.sqrt(0.4))
+
+    def test_repeat_segment_with_single_depth(self):
+        # If segment 2 only has the start/end depth, it disagrees with appearing twice.
+        self.graph.segments[2].depth = 10.0
+        bridge = self.make_bridge()
+        self.assertAlmostEqual(bridge.quality, 100.0 * math.sqrt(0.4 * 0.5))
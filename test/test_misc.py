@@ -163,6 +163,10 @@ class TestMiscFunctions(unittest.TestCase):
         self.assertAlmostEqual(0.0, unicycler.misc.get_num_agreement(0.0, 200.0))
         self.assertAlmostEqual(0.5, unicycler.misc.get_num_agreement(1.0, 2.0))
         self.assertAlmostEqual(0.5, unicycler.misc.get_num_agreement(100.0, 200.0))
+        self.assertAlmostEqual(1.0, unicycler.misc.get_num_agreement(0.0, 0.0))
+        self.assertAlmostEqual(1.0, unicycler.misc.get_num_agreement(-3.0, -3.0))
+        self.assertAlmostEqual(0.5, unicycler.misc.get_num_agreement(-1.0, -2.0))
+        self.assertAlmostEqual(0.0, unicycler.misc.get_num_agreement(-1.0, 2.0))
 
     def test_flip_number_order(self):
         self.assertEqual(unicycler.misc.flip_number_order(5, 6), ((5, 6), False))
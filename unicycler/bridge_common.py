@@ -28,13 +28,29 @@ def get_mean_depth(seg_1, seg_2, graph):
                             seg_2.get_length_no_overlap(graph.overlap))
 
 
+def precompute_paths(graph):
+    """
+    Returns a list of tuples for the graph's SPAdes contig paths, for use when making SPAdes contig
+    bridges and loop unrolling bridges. Each tuple contains:
+      * the path
+      * the flipped path (reverse order, opposite signs)
+      * a set of the path's segment numbers
+      * a set of the flipped path's segment numbers
+    """
+    paths = []
+    for path in graph.paths.values():
+        flipped_path = [-x for x in reversed(path)]
+        paths.append((path, flipped_path, set(path), set(flipped_path)))
+    return paths
+
+
 def get_bridge_str(bridge):
     """
     Returns a bridge sequence in human-readable form.
     """
     bridge_str = str(bridge.start_segment) + ' -> '
     if bridge.graph_path:
-        bridge_str += ', '.join([str(x) for x in bridge.graph_path]) + ' -> '
+        bridge_str += ', '.join(map(str, bridge.graph_path)) + ' -> '
     bridge_str += str(bridge.end_segment)
     return bridge_str
 
@@ -19,6 +19,7 @@ import time
 import math
 import statistics
 import sys
+import bisect
 from collections import defaultdict
 from .bridge_common import get_bridge_str, get_mean_depth, get_depth_agreement_factor, \
     get_bridge_table_parameters, print_bridge_table_header, print_bridge_table_row
@@ -409,7 +410,7 @@ def create_long_read_bridges(graph, read_dict, read_names, anchor_segments, verb
                         'read, giving Unicycler the ability to bridge the graph even when '
                         'long-read depth is low.')
 
-    anchor_seg_nums = set(x.number for x in anchor_segments)
+    anchor_seg_nums = frozenset(x.number for x in anchor_segments)
 
     # This dictionary will collect the read sequences which span between two single copy segments.
     # Key = tuple of signed segment numbers (the segments being bridged)
@@ -429,7 +430,13 @@ def create_long_read_bridges(graph, read_dict, read_names, anchor_segments, verb
         # potentially also more distant pairs if the alignments are strong.
         already_added = set()
         sorted_alignments = sorted(alignments, key=lambda x: x.raw_score, reverse=True)
+
+        # available_alignments is kept sorted by read start position as alignments are added.
+        # available_starts holds those start positions in the same order, so each alignment can
+        # be inserted in its place without re-sorting the whole list.
         available_alignments = []
+        available_starts = []
+        available_ref_nums = set()
         for alignment in sorted_alignments:
 
             # If the alignment being added is to a reference that has already been added but in the
@@ -438,30 +445,34 @@ def create_long_read_bridges(graph, read_dict, read_names, anchor_segments, verb
             # for a single copy segment to appear in the same read in two different directions. The
             # same direction is okay, as that can happen with a circular piece of DNA, but opposite
             # directions implies multi-copy.
-            opposite_num = -alignment.get_signed_ref_num()
-            if opposite_num in set(x.get_signed_ref_num() for x in available_alignments):
+            signed_ref_num = alignment.get_signed_ref_num()
+            if -signed_ref_num in available_ref_nums:
                 continue
 
-            available_alignments.append(alignment)
-            available_alignments = sorted(available_alignments,
-                                          key=lambda x: x.read_start_positive_strand())
+            read_start = alignment.read_start_positive_strand()
+            insert_index = bisect.bisect_right(available_starts, read_start)
+            available_starts.insert(insert_index, read_start)
+            available_alignments.insert(insert_index, alignment)
+            available_ref_nums.add(signed_ref_num)
             if len(available_alignments) < 2:
                 continue
 
-            for i in range(len(available_alignments)):
-                if i < len(available_alignments) - 1:
-                    alignment_1 = available_alignments[i]
-                    alignment_2 = available_alignments[i + 1]
-
-                # Special case: when the first and last alignments are to the same graph segment,
-                # make a bridge for them, even if they aren't a particularly high scoring pair of
-                # alignments. This can help to circularise plasmids which are very tied up with
-                # other, similar plasmids.
-                elif available_alignments[0].ref.name == available_alignments[-1].ref.name:
-                    alignment_1 = available_alignments[0]
-                    alignment_2 = available_alignments[-1]
-                else:
-                    continue
+            # Every other neighbouring pair was already considered when its alignments were
+            # added, so only the pairs next to the new alignment can be new.
+            alignment_pairs = []
+            if insert_index > 0:
+                alignment_pairs.append((available_alignments[insert_index - 1], alignment))
+            if insert_index < len(available_alignments) - 1:
+                alignment_pairs.append((alignment, available_alignments[insert_index + 1]))
+
+            # Special case: when the first and last alignments are to the same graph segment,
+            # make a bridge for them, even if they aren't a particularly high scoring pair of
+            # alignments. This can help to circularise plasmids which are very tied up with
+            # other, similar plasmids.
+            if available_alignments[0].ref.name == available_alignments[-1].ref.name:
+                alignment_pairs.append((available_alignments[0], available_alignments[-1]))
+
+            for alignment_1, alignment_2 in alignment_pairs:
 
                 # Standardise the order so we don't end up with both directions (e.g. 5 to -6 and
                 # 6 to -5) in spanning_read_seqs.
@@ -594,12 +605,8 @@ def get_single_copy_alignments(read, single_copy_num_set, min_scaled_score):
     """
     Returns a list of single copy segment alignments for the read.
     """
-    sc_alignments = []
-    for alignment in read.alignments:
-        if alignment.ref.number in single_copy_num_set and \
-                        alignment.scaled_score >= min_scaled_score:
-            sc_alignments.append(alignment)
-    return sc_alignments
+    return [x for x in read.alignments
+            if x.ref.number in single_copy_num_set and x.scaled_score >= min_scaled_score]
 
 
 def finalise_bridge(all_args):
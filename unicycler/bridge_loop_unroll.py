@@ -98,9 +98,7 @@ class LoopUnrollingBridge(object):
         loop_count_penalty = 1 / (2 ** (self.loop_count - 1))
         self.quality *= loop_count_penalty
 
-        self.graph_path = [repeat]
-        for _ in range(self.loop_count):
-            self.graph_path += [middle, repeat]
+        self.graph_path = [repeat] + [middle, repeat] * self.loop_count
         self.bridge_sequence = graph.get_path_sequence(self.graph_path)
 
         # We finalise the quality to a range of 0 to 100. We also use the sqrt function to pull
@@ -127,9 +125,10 @@ class LoopUnrollingBridge(object):
         return 'loop'
 
 
-def create_loop_unrolling_bridges(graph, anchor_segments):
+def create_loop_unrolling_bridges(graph, anchor_segments, spades_paths):
     """
     This function creates loop unrolling bridges using the information in SPAdes paths.
+    spades_paths comes from precompute_paths.
     """
     log.log_section_header('Creating loop unrolling bridges')
     log.log_explanation('When a SPAdes contig path connects an anchor contig with the '
@@ -158,15 +157,11 @@ def create_loop_unrolling_bridges(graph, anchor_segments):
         if abs(repeat) in seg_nums_to_bridge:
             continue
 
-        joined = False
-        for path in graph.paths.values():
-            flipped_path = [-x for x in reversed(path)]
-            if (start in path and middle in path) or \
-                    (end in path and middle in path) or \
-                    (start in flipped_path and middle in flipped_path) or \
-                    (end in flipped_path and middle in flipped_path):
-                joined = True
-                break
+        joined = any((start in path_set and middle in path_set) or
+                     (end in path_set and middle in path_set) or
+                     (start in flipped_set and middle in flipped_set) or
+                     (end in flipped_set and middle in flipped_set)
+                     for _, _, path_set, flipped_set in spades_paths)
 
         # If we've found evidence the simply loop is a single piece of DNA, then we'll make a loop
         # unrolling bridge!
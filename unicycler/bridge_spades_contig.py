@@ -14,6 +14,7 @@ not, see <http://www.gnu.org/licenses/>.
 """
 
 import math
+from collections import Counter, defaultdict
 from .bridge_common import get_bridge_str, get_mean_depth, get_depth_agreement_factor
 from .misc import float_to_str, get_num_agreement, get_right_arrow, print_table
 from . import log
@@ -28,7 +29,7 @@ class SpadesContigBridge(object):
       * The depth consistency within the path (only applies to bridges where the path segments
         exclusively lead to the start/end segments).
     """
-    def __init__(self, graph, spades_contig_path):
+    def __init__(self, graph, spades_contig_path, connected_segments):
 
         # The numbers of the two single copy segments which are being bridged.
         self.start_segment = None
@@ -74,11 +75,14 @@ class SpadesContigBridge(object):
         # segment's depth also suggests about 3 times, that's good. If they don't agree, that's
         # bad.
         self.depth = get_mean_depth(start_seg, end_seg, graph)
-        if path_is_self_contained(self.graph_path, self.start_segment, self.end_segment, graph):
-            graph_path_pos_nums = list(set([abs(x) for x in self.graph_path]))
-            for path_segment in graph_path_pos_nums:
-                actual_depth = graph.segments[path_segment].depth
-                expected_depth = graph_path_pos_nums.count(path_segment) * self.depth
+        abs_path = list(map(abs, self.graph_path))
+        if path_is_self_contained(abs_path, abs(self.start_segment), abs(self.end_segment),
+                                  connected_segments):
+            segments = graph.segments
+            path_segment_counts = Counter(abs_path)
+            for path_segment, count in path_segment_counts.items():
+                actual_depth = segments[path_segment].depth
+                expected_depth = count * self.depth
                 agreement = get_num_agreement(actual_depth, expected_depth)
                 self.quality *= agreement
 
@@ -119,9 +123,9 @@ class SpadesContigBridge(object):
         return 'SPAdes'
 
 
-def create_spades_contig_bridges(graph, anchor_segments):
+def create_spades_contig_bridges(graph, anchor_segments, spades_paths):
     """
-    Builds graph bridges using the SPAdes contig paths.
+    Builds graph bridges using the SPAdes contig paths. spades_paths comes from precompute_paths.
     """
     log.log_section_header('Creating SPAdes contig bridges')
     log.log_explanation('SPAdes uses paired-end information to perform repeat resolution (RR) and '
@@ -131,59 +135,62 @@ def create_spades_contig_bridges(graph, anchor_segments):
                         'create a bridge from the path.', verbosity=1)
 
     bridge_path_set = set()
-    single_copy_numbers = [x.number for x in anchor_segments]
+
+    # Both signs of the anchor segment numbers are included, so a path segment can be checked
+    # with a single lookup.
+    single_copy_numbers = set(x.number for x in anchor_segments)
+    single_copy_numbers.update([-x for x in single_copy_numbers])
+
+    # The paths (and their flipped versions) are the same for every segment, so we index their
+    # segment positions once.
+    indexed_paths = []
+    for path, flipped_path, _, _ in spades_paths:
+        indexed_paths.append((path, get_segment_positions(path)))
+        indexed_paths.append((flipped_path, get_segment_positions(flipped_path)))
+
     for segment in anchor_segments:
-        for path in graph.paths.values():
-            flipped_path = [-x for x in reversed(path)]
-            contig_bridges = find_contig_bridges(segment.number, path, single_copy_numbers)
-            contig_bridges += find_contig_bridges(segment.number, flipped_path, single_copy_numbers)
+        for path, segment_positions in indexed_paths:
+            contig_bridges = find_contig_bridges(segment.number, path, segment_positions,
+                                                 single_copy_numbers)
             for contig_bridge in contig_bridges:
-                flipped_contig_bridge = [-x for x in reversed(contig_bridge)]
-                contig_bridge_str = ','.join([str(x) for x in contig_bridge])
-                flipped_contig_bridge_str = ','.join([str(x) for x in flipped_contig_bridge])
-                if contig_bridge_str not in bridge_path_set and \
-                        flipped_contig_bridge_str not in bridge_path_set:
+                contig_bridge_tuple = tuple(contig_bridge)
+                flipped_contig_bridge_tuple = tuple(-x for x in reversed(contig_bridge))
+                if contig_bridge_tuple not in bridge_path_set and \
+                        flipped_contig_bridge_tuple not in bridge_path_set:
                     if contig_bridge[0] < 0 and contig_bridge[-1] < 0:
-                        bridge_path_set.add(flipped_contig_bridge_str)
+                        bridge_path_set.add(flipped_contig_bridge_tuple)
                     else:
-                        bridge_path_set.add(contig_bridge_str)
+                        bridge_path_set.add(contig_bridge_tuple)
 
-    bridge_path_list = sorted(list([[int(y) for y in x.split(',')] for x in bridge_path_set]))
+    bridge_path_list = sorted(list(x) for x in bridge_path_set)
 
     # If multiple bridge paths start with or end with the same segment, that implies a conflict
     # between SPADes' paths and our single copy determination. Throw these bridges out.
-    bridge_paths_by_start = {}
-    bridge_paths_by_end = {}
+    bridge_paths_by_start = defaultdict(list)
+    bridge_paths_by_end = defaultdict(list)
     for path in bridge_path_list:
         start = path[0]
         end = path[-1]
-        if start not in bridge_paths_by_start:
-            bridge_paths_by_start[start] = []
-        if end not in bridge_paths_by_end:
-            bridge_paths_by_end[end] = []
-        if -end not in bridge_paths_by_start:
-            bridge_paths_by_start[-end] = []
-        if -start not in bridge_paths_by_end:
-            bridge_paths_by_end[-start] = []
         bridge_paths_by_start[start].append(path)
         bridge_paths_by_end[end].append(path)
         bridge_paths_by_start[-end].append(path)
         bridge_paths_by_end[-start].append(path)
-    conflicting_paths = []
+    conflicting_path_set = set()
     for grouped_paths in bridge_paths_by_start.values():
         if len(grouped_paths) > 1:
-            conflicting_paths += grouped_paths
+            conflicting_path_set.update(map(tuple, grouped_paths))
     for grouped_paths in bridge_paths_by_end.values():
         if len(grouped_paths) > 1:
-            conflicting_paths += grouped_paths
-    conflicting_paths_no_dupes = []
-    for path in conflicting_paths:
-        if path not in conflicting_paths_no_dupes:
-            conflicting_paths_no_dupes.append(path)
-    conflicting_paths = conflicting_paths_no_dupes
-    final_bridge_paths = [x for x in bridge_path_list if x not in conflicting_paths]
+            conflicting_path_set.update(map(tuple, grouped_paths))
+    final_bridge_paths = [x for x in bridge_path_list if tuple(x) not in conflicting_path_set]
 
-    bridges = [SpadesContigBridge(spades_contig_path=x, graph=graph) for x in final_bridge_paths]
+    # Each bridge checks whether its path is self-contained, so we look up the connections for
+    # each segment in the bridge paths once and share them between the bridges.
+    path_seg_nums = set(abs(x) for path in final_bridge_paths for x in path[1:-1])
+    connected_segments = {x: set(graph.get_connected_segments(x)) for x in path_seg_nums}
+    bridges = [SpadesContigBridge(spades_contig_path=x, graph=graph,
+                                  connected_segments=connected_segments)
+               for x in final_bridge_paths]
 
     if bridges:
         bridge_table = [['Start', 'Path', 'End', 'Bridge quality']]
@@ -202,18 +209,30 @@ def create_spades_contig_bridges(graph, anchor_segments):
     return bridges
 
 
-def find_contig_bridges(segment_num, path, single_copy_numbers):
+def get_segment_positions(path):
+    """
+    Returns a dictionary of positive segment number -> list of the indices where that segment
+    occurs in the path (in either direction).
+    """
+    segment_positions = defaultdict(list)
+    for i, seg_num in enumerate(map(abs, path)):
+        segment_positions[seg_num].append(i)
+    return segment_positions
+
+
+def find_contig_bridges(segment_num, path, segment_positions, single_copy_numbers):
     """
     This function returns a list of lists: every part of the path which starts on the segment_num
-    and ends on any of the single_copy_numbers.
+    and ends on any of the single_copy_numbers. The segment_positions dictionary comes from
+    get_segment_positions and single_copy_numbers must contain both signs of each number.
     """
     bridge_paths = []
-    indices = [i for i, x in enumerate(path) if abs(x) == segment_num]
-    for index in indices:
+    path_length = len(path)
+    for index in segment_positions.get(segment_num, []):
         bridge_path = [path[index]]
-        for i in range(index + 1, len(path)):
+        for i in range(index + 1, path_length):
             bridge_path.append(path[i])
-            if path[i] in single_copy_numbers or -path[i] in single_copy_numbers:
+            if path[i] in single_copy_numbers:
                 break
         else:
             bridge_path = []
@@ -222,19 +241,19 @@ def find_contig_bridges(segment_num, path, single_copy_numbers):
     return bridge_paths
 
 
-def path_is_self_contained(path, start, end, graph):
+def path_is_self_contained(abs_path, abs_start, abs_end, connected_segments):
     """
     Returns True if the path segments are only connected to each other and the start/end segments.
     If they are connected to anything else, it returns False.
+
+    All segment numbers given to this function must be positive (i.e. not strand-specific).
+    connected_segments is a dictionary of positive segment number -> set of positive numbers for
+    the segments directly connected to it.
     """
-    all_numbers_in_path = set()
-    all_numbers_in_path.add(abs(start))
-    all_numbers_in_path.add(abs(end))
-    for segment in path:
-        all_numbers_in_path.add(abs(segment))
-    for segment in path:
-        connected_segments = graph.get_connected_segments(segment)
-        for connected_segment in connected_segments:
-            if connected_segment not in all_numbers_in_path:
-                return False
+    all_numbers_in_path = set(abs_path)
+    all_numbers_in_path.add(abs_start)
+    all_numbers_in_path.add(abs_end)
+    for segment in abs_path:
+        if not connected_segments[segment].issubset(all_numbers_in_path):
+            return False
     return True
@@ -348,7 +348,7 @@ def get_num_agreement(num_1, num_2):
     Returns a value between 0.0 and 1.0 describing how well the numbers agree.
     1.0 is perfect agreement and 0.0 is the worst.
     """
-    if num_1 == 0.0 and num_2 == 0.0:
+    if num_1 == num_2:
         return 1.0
     if num_1 < 0.0 and num_2 < 0.0:
         num_1 *= -1
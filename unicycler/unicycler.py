@@ -30,6 +30,7 @@ from .bridge_miniasm import create_miniasm_bridges
 from .bridge_long_read import create_long_read_bridges
 from .bridge_spades_contig import create_spades_contig_bridges
 from .bridge_loop_unroll import create_loop_unrolling_bridges
+from .bridge_common import precompute_paths
 from .misc import int_to_str, float_to_str, quit_with_error, get_percentile, bold, \
     check_input_files, MyHelpFormatter, print_table, get_ascii_art, \
     get_default_thread_count, spades_path_and_version, makeblastdb_path_and_version, \
@@ -112,8 +113,9 @@ def main():
         # Make an initial set of bridges using the SPAdes contig paths. This step is skipped when
         # using conservative bridging mode (in that case we don't trust SPAdes contig paths at all).
         if args.mode != 0:
-            bridges += create_spades_contig_bridges(graph, anchor_segments)
-            bridges += create_loop_unrolling_bridges(graph, anchor_segments)
+            spades_paths = precompute_paths(graph)
+            bridges += create_spades_contig_bridges(graph, anchor_segments, spades_paths)
+            bridges += create_loop_unrolling_bridges(graph, anchor_segments, spades_paths)
             if not bridges:
                 log.log('none found', 1)
 